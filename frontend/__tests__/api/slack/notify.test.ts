@@ -17,6 +17,7 @@ const mockCreateErrorResponse = utils.createErrorResponse as jest.MockedFunction
 const mockLogInfo = utils.logInfo as jest.MockedFunction<typeof utils.logInfo>;
 const mockLogError = utils.logError as jest.MockedFunction<typeof utils.logError>;
 const mockLogSuccess = utils.logSuccess as jest.MockedFunction<typeof utils.logSuccess>;
+const mockFormatShortTimestamp = utils.formatShortTimestamp as jest.MockedFunction<typeof utils.formatShortTimestamp>;
 
 describe('/api/slack/notify', () => {
   const validRequestBody = {
@@ -33,6 +34,9 @@ describe('/api/slack/notify', () => {
     mockLogInfo.mockImplementation();
     mockLogError.mockImplementation();
     mockLogSuccess.mockImplementation();
+    mockFormatShortTimestamp.mockImplementation(
+      jest.requireActual<typeof utils>('@/lib/utils').formatShortTimestamp
+    );
     
     // Mock environment variables
     process.env.NEXTAUTH_URL = 'https://example.com';
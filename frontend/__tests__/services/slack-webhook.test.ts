@@ -8,6 +8,14 @@ import {
   sendSimpleSlackNotification,
   testSlackWebhook,
 } from '@/lib/services/slack-webhook';
+import { sleep } from '@/lib/utils';
+
+// Skip real backoff delays between rate-limit retries
+jest.mock('@/lib/utils', () => ({
+  ...jest.requireActual('@/lib/utils'),
+  sleep: jest.fn(() => Promise.resolve()),
+}));
+const mockSleep = sleep as jest.MockedFunction<typeof sleep>;
 
 // Mock fetch globally
 global.fetch = jest.fn();
@@ -16,6 +24,7 @@ const mockFetch = global.fetch as jest.MockedFunction<typeof fetch>;
 // Mock console methods
 const originalConsoleLog = console.log;
 const originalConsoleError = console.error;
+const originalConsoleWarn = console.warn;
 
 describe('Slack Webhook Service', () => {
   beforeEach(() => {
@@ -27,6 +36,7 @@ describe('Slack Webhook Service', () => {
   afterAll(() => {
     console.log = originalConsoleLog;
     console.error = originalConsoleError;
+    console.warn = originalConsoleWarn;
   });
 
   describe('sendIntercomNotification', () => {
@@ -402,6 +412,121 @@ describe('Slack Webhook Service', () => {
     });
   });
 
+  describe('Rate Limit Retries', () => {
+    const rateLimitedResponse = (retryAfter?: string) => ({
+      ok: false,
+      status: 429,
+      statusText: 'Too Many Requests',
+      headers: new Map(retryAfter ? [['retry-after', retryAfter]] : []),
+    } as unknown as Response);
+
+    beforeEach(() => {
+      console.warn = jest.fn();
+      jest.spyOn(Math, 'random').mockReturnValue(0);
+      mockSleep.mockImplementation(() => Promise.resolve());
+    });
+
+    afterEach(() => {
+      (Math.random as jest.Mock).mockRestore();
+    });
+
+    it('should retry a 429 response and succeed', async () => {
+      mockFetch
+        .mockResolvedValueOnce(rateLimitedResponse())
+        .mockResolvedValueOnce({ ok: true, status: 200 } as Response);
+
+      const result = await sendSimpleSlackNotification('Retry test');
+
+      expect(result).toBe(true);
+      expect(mockFetch).toHaveBeenCalledTimes(2);
+      expect(mockSleep).toHaveBeenCalledWith(500);
+      expect(mockFetch.mock.calls[1][1]!.body).toBe(mockFetch.mock.calls[0][1]!.body);
+    });
+
+    it('should back off exponentially without Retry-After', async () => {
+      mockFetch.mockResolvedValue(rateLimitedResponse());
+
+      const result = await sendSimpleSlackNotification('Backoff test');
+
+      expect(result).toBe(false);
+      expect(mockFetch).toHaveBeenCalledTimes(3);
+      expect(mockSleep.mock.calls).toEqual([[500], [1000]]);
+      expect(console.error).toHaveBeenCalledWith(
+        'Simple Slack notification failed:',
+        429,
+        'Too Many Requests'
+      );
+    });
+
+    it('should honour the Retry-After header', async () => {
+      mockFetch
+        .mockResolvedValueOnce(rateLimitedResponse('3'))
+        .mockResolvedValueOnce({ ok: true, status: 200 } as Response);
+
+      const result = await sendIntercomNotification({
+        visitorName: 'Retry',
+        purpose: 'Test',
+        roomName: 'room-retry',
+        joinUrl: 'https://retry.com',
+      });
+
+      expect(result).toBe(true);
+      expect(mockSleep).toHaveBeenCalledWith(3000);
+    });
+
+    it('should return the 429 without waiting when Retry-After exceeds the cap', async () => {
+      mockFetch.mockResolvedValue(rateLimitedResponse('30'));
+
+      const result = await sendSimpleSlackNotification('Long wait test');
+
+      expect(result).toBe(false);
+      expect(mockFetch).toHaveBeenCalledTimes(1);
+      expect(mockSleep).not.toHaveBeenCalled();
+      expect(console.error).toHaveBeenCalledWith(
+        'Simple Slack notification failed:',
+        429,
+        'Too Many Requests'
+      );
+    });
+
+    it('should stop retrying once the total retry budget is spent', async () => {
+      let now = 0;
+      jest.spyOn(Date, 'now').mockImplementation(() => now);
+      mockSleep.mockImplementation(async (ms: number) => {
+        now += ms;
+      });
+      mockFetch.mockResolvedValue(rateLimitedResponse('10'));
+
+      const result = await sendSimpleSlackNotification('Budget test');
+
+      expect(result).toBe(false);
+      expect(mockFetch).toHaveBeenCalledTimes(2);
+      expect(mockSleep.mock.calls).toEqual([[10000]]);
+
+      (Date.now as jest.Mock).mockRestore();
+    });
+
+    it('should not retry network errors', async () => {
+      mockFetch.mockRejectedValue(new Error('Network error'));
+
+      const result = await sendSimpleSlackNotification('No retry network test');
+
+      expect(result).toBe(false);
+      expect(mockFetch).toHaveBeenCalledTimes(1);
+      expect(mockSleep).not.toHaveBeenCalled();
+    });
+
+    it('should not retry other error statuses', async () => {
+      mockFetch.mockResolvedValue({ ok: false, status: 500, statusText: 'Internal Server Error' } as Response);
+
+      const result = await sendSimpleSlackNotification('No retry test');
+
+      expect(result).toBe(false);
+      expect(mockFetch).toHaveBeenCalledTimes(1);
+      expect(mockSleep).not.toHaveBeenCalled();
+    });
+  });
+
   describe('Logging Behavior', () => {
     it('should log success for intercom notifications', async () => {
       mockFetch.mockResolvedValue({ ok: true } as Response);
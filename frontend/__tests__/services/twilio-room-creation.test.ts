@@ -0,0 +1,99 @@
+// Tests for Twilio room creation against the REST API (timeouts and error handling)
+
+import { describe, it, expect, beforeEach, jest } from '@jest/globals';
+import { TwilioService } from '@/lib/services/twilio';
+
+jest.mock('@/lib/config', () => ({
+  getTwilioConfig: () => ({
+    accountSid: 'ACtest',
+    authToken: 'test_auth_token',
+    apiKey: 'SKtest',
+    apiSecret: 'test_api_secret',
+    frontendUrl: 'http://localhost:3001',
+    useMock: false,
+  }),
+}));
+
+const mockFetch = jest.fn<typeof fetch>();
+global.fetch = mockFetch;
+
+const roomResponse = (sid: string) => ({
+  ok: true,
+  status: 201,
+  json: () => Promise.resolve({ sid }),
+} as unknown as Response);
+
+const errorResponse = (status: number, body: string) => ({
+  ok: false,
+  status,
+  text: () => Promise.resolve(body),
+} as unknown as Response);
+
+const sentBody = (call: number) => mockFetch.mock.calls[call][1]!.body as URLSearchParams;
+
+describe('Twilio Room Timeout Capability', () => {
+  beforeEach(() => {
+    mockFetch.mockReset();
+    jest.spyOn(console, 'log').mockImplementation(() => {});
+  });
+
+  it('should send trial timeouts when the account accepts them', async () => {
+    const twilioService = new TwilioService();
+    mockFetch.mockResolvedValue(roomResponse('RM1'));
+
+    const room = await twilioService.createRoom('TestUser');
+
+    expect(room.room_sid).toBe('RM1');
+    expect(mockFetch).toHaveBeenCalledTimes(1);
+    expect(sentBody(0).get('EmptyRoomTimeout')).toBe('60');
+    expect(sentBody(0).get('UnusedRoomTimeout')).toBe('60');
+  });
+
+  it('should skip the timeout attempt after the account rejects it once', async () => {
+    const twilioService = new TwilioService();
+    mockFetch
+      .mockResolvedValueOnce(errorResponse(400, '{"message": "Timeout is out of range"}'))
+      .mockResolvedValueOnce(roomResponse('RM1'))
+      .mockResolvedValueOnce(roomResponse('RM2'));
+
+    const first = await twilioService.createRoom('TestUser');
+    const second = await twilioService.createRoom('TestUser');
+
+    expect(first.room_sid).toBe('RM1');
+    expect(second.room_sid).toBe('RM2');
+    expect(mockFetch).toHaveBeenCalledTimes(3);
+    expect(sentBody(1).has('EmptyRoomTimeout')).toBe(false);
+    expect(sentBody(2).has('EmptyRoomTimeout')).toBe(false);
+  });
+});
+
+describe('Twilio Room Creation Errors', () => {
+  beforeEach(() => {
+    mockFetch.mockReset();
+    jest.spyOn(console, 'log').mockImplementation(() => {});
+    jest.spyOn(console, 'error').mockImplementation(() => {});
+  });
+
+  it('should report authentication failures from a 401 response', async () => {
+    const twilioService = new TwilioService();
+    mockFetch.mockResolvedValue(errorResponse(401, '{"code": 20003, "message": "Authenticate", "status": 401}'));
+
+    await expect(twilioService.createRoom('TestUser')).rejects.toThrow('Twilio authentication failed');
+  });
+
+  it('should report an invalid room type from the Twilio message', async () => {
+    const twilioService = new TwilioService();
+    mockFetch.mockResolvedValue(errorResponse(400, '{"message": "Type must be one of group, peer-to-peer", "status": 400}'));
+
+    await expect(twilioService.createRoom('TestUser')).rejects.toThrow('Invalid room type');
+  });
+
+  it('should fall back to a mock room for other Twilio errors', async () => {
+    const twilioService = new TwilioService();
+    mockFetch.mockResolvedValue(errorResponse(500, 'Internal Server Error'));
+
+    const room = await twilioService.createRoom('TestUser');
+
+    expect(room.mock).toBe(true);
+  });
+});
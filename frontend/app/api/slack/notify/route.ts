@@ -2,7 +2,7 @@
 
 import { NextRequest, NextResponse } from 'next/server';
 import { sendIntercomNotification } from '@/lib/services/slack-webhook';
-import { createErrorResponse, logInfo, logError, logSuccess } from '@/lib/utils';
+import { createErrorResponse, formatShortTimestamp, logInfo, logError, logSuccess } from '@/lib/utils';
 
 interface NotificationRequest {
   visitorName: string;
@@ -42,14 +42,7 @@ export async function POST(request: NextRequest) {
       purpose: body.purpose || 'お客様対応',
       roomName: body.roomName,
       joinUrl,
-      timestamp: new Date().toLocaleString('ja-JP', {
-        timeZone: 'Asia/Tokyo',
-        year: 'numeric',
-        month: '2-digit',
-        day: '2-digit',
-        hour: '2-digit',
-        minute: '2-digit',
-      }),
+      timestamp: formatShortTimestamp(new Date()),
     };
 
     logInfo(`Sending Slack notification for visitor: ${body.visitorName}, room: ${body.roomName}`);
@@ -65,24 +65,6 @@ class SimpleApiClient {
     return this.request(`/calendar/check?${query}`);
   }
 
-  // Notification API
-  async sendSlackNotification(data: {
-    message_type: "visitor" | "video_call" | "error";
-    visitor_info?: {
-      name: string;
-      company: string;
-      email?: string;
-      purpose?: string;
-    };
-    session_id?: string;
-    additional_data?: Record<string, any>;
-  }) {
-    return this.request('/notification/slack', {
-      method: 'POST',
-      body: JSON.stringify(data),
-    });
-  }
-
   // Video API
   async createVideoRoom(data: { visitorName: string; purpose: string }) {
     return this.request('/video/create', {
@@ -1,5 +1,7 @@
 // Simple Slack webhook service for intercom notifications
 
+import { formatShortTimestamp, sleep } from '../utils';
+
 interface SlackNotificationData {
   visitorName: string;
   purpose: string;
@@ -15,31 +17,100 @@ interface SlackMessage {
 
 const SLACK_WEBHOOK_URL = process.env.SLACK_WEBHOOK_URL || '';
 
+// Static parts of the intercom message, built once and shared by every
+// notification (they are only serialized, never mutated)
+const INTERCOM_HEADER_BLOCK = {
+  type: 'header',
+  text: {
+    type: 'plain_text',
+    text: '🔔 受付通知',
+    emoji: true
+  }
+};
+
+const JOIN_BUTTON_TEXT = {
+  type: 'plain_text',
+  text: '📹 ビデオ通話に参加',
+  emoji: true
+};
+
+const INTERCOM_CONTEXT_BLOCK = {
+  type: 'context',
+  elements: [
+    {
+      type: 'mrkdwn',
+      text: '上のボタンからビデオ通話に参加してお客様と話すことができます。'
+    }
+  ]
+};
+
+// Retry policy for rate-limited (429) webhook posts. The waits happen inside
+// the notify request, so a single wait or the running total past its cap
+// returns the 429 right away.
+const MAX_RATE_LIMIT_RETRIES = 2;
+const RETRY_BASE_DELAY_MS = 500;
+const MAX_RETRY_DELAY_MS = 10_000;
+const MAX_TOTAL_RETRY_MS = 10_000;
+
+/**
+ * POST a payload to the Slack webhook, retrying 429 responses with
+ * jittered exponential backoff (or the Retry-After delay when Slack sends one).
+ * 5xx responses and network errors are not retried: the webhook POST is not
+ * idempotent, and Slack may already have posted the message.
+ */
+async function postToSlackWebhook(payload: SlackMessage): Promise<Response> {
+  const body = JSON.stringify(payload);
+  const startedAt = Date.now();
+
+  for (let attempt = 0; ; attempt++) {
+    const response = await fetch(SLACK_WEBHOOK_URL, {
+      method: 'POST',
+      headers: {
+        'Content-Type': 'application/json',
+      },
+      body,
+    });
+
+    if (response.status !== 429 || attempt >= MAX_RATE_LIMIT_RETRIES) {
+      return response;
+    }
+
+    const retryAfterSeconds = Number(response.headers.get('retry-after'));
+    const baseDelayMs = Number.isFinite(retryAfterSeconds) && retryAfterSeconds > 0
+      ? retryAfterSeconds * 1000
+      : RETRY_BASE_DELAY_MS * 2 ** attempt;
+
+    if (baseDelayMs > MAX_RETRY_DELAY_MS) {
+      console.warn(`⚠️ Slack rate limited for ${baseDelayMs}ms, longer than the ${MAX_RETRY_DELAY_MS}ms retry cap`);
+      return response;
+    }
+
+    const delayMs = Math.min(
+      Math.round(baseDelayMs + Math.random() * RETRY_BASE_DELAY_MS),
+      MAX_RETRY_DELAY_MS
+    );
+
+    if (Date.now() - startedAt + delayMs > MAX_TOTAL_RETRY_MS) {
+      console.warn(`⚠️ Slack still rate limited, giving up within the ${MAX_TOTAL_RETRY_MS}ms total retry budget`);
+      return response;
+    }
+
+    console.warn(`⚠️ Slack rate limited, retrying in ${delayMs}ms (attempt ${attempt + 1}/${MAX_RATE_LIMIT_RETRIES})`);
+    await sleep(delayMs);
+  }
+}
+
 /**
  * Send a notification to Slack when a visitor arrives at the intercom
  */
 export async function sendIntercomNotification(data: SlackNotificationData): Promise<boolean> {
   try {
-    const timestamp = data.timestamp || new Date().toLocaleString('ja-JP', {
-      timeZone: 'Asia/Tokyo',
-      year: 'numeric',
-      month: '2-digit',
-      day: '2-digit',
-      hour: '2-digit',
-      minute: '2-digit',
-    });
+    const timestamp = data.timestamp || formatShortTimestamp(new Date());
 
     const message: SlackMessage = {
       text: `受付にお客様がいらっしゃいました - ${data.visitorName}`,
       blocks: [
-        {
-          type: 'header',
-          text: {
-            type: 'plain_text',
-            text: '🔔 受付通知',
-            emoji: true
-          }
-        },
+        INTERCOM_HEADER_BLOCK,
         {
           type: 'section',
           fields: [
@@ -66,36 +137,18 @@ export async function sendIntercomNotification(data: SlackNotificationData): Pro
           elements: [
             {
               type: 'button',
-              text: {
-                type: 'plain_text',
-                text: '📹 ビデオ通話に参加',
-                emoji: true
-              },
+              text: JOIN_BUTTON_TEXT,
               style: 'primary',
               url: data.joinUrl,
               action_id: 'join_video_call'
             }
           ]
         },
-        {
-          type: 'context',
-          elements: [
-            {
-              type: 'mrkdwn',
-              text: '上のボタンからビデオ通話に参加してお客様と話すことができます。'
-            }
-          ]
-        }
+        INTERCOM_CONTEXT_BLOCK,
       ]
     };
 
-    const response = await fetch(SLACK_WEBHOOK_URL, {
-      method: 'POST',
-      headers: {
-        'Content-Type': 'application/json',
-      },
-      body: JSON.stringify(message),
-    });
+    const response = await postToSlackWebhook(message);
 
     if (!response.ok) {
       console.error('Slack notification failed:', response.status, response.statusText);
@@ -120,13 +173,7 @@ export async function sendSimpleSlackNotification(message: string): Promise<bool
       text: message
     };
 
-    const response = await fetch(SLACK_WEBHOOK_URL, {
-      method: 'POST',
-      headers: {
-        'Content-Type': 'application/json',
-      },
-      body: JSON.stringify(payload),
-    });
+    const response = await postToSlackWebhook(payload);
 
     if (!response.ok) {
       console.error('Simple Slack notification failed:', response.status, response.statusText);
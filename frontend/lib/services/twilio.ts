@@ -1,5 +1,6 @@
 // Twilio Video service for Next.js (ported from Python)
 
+import { createHmac, createSecretKey, KeyObject, randomBytes } from 'crypto';
 import { v4 as uuidv4 } from 'uuid';
 import { getTwilioConfig } from '../config';
 
@@ -43,6 +44,65 @@ interface JWTPayload {
   };
 }
 
+// The JWT header never changes, so encode it once at module load
+const JWT_HEADER: JWTHeader = {
+  alg: 'HS256',
+  typ: 'JWT',
+  cty: 'twilio-fpa;v=1'
+};
+const JWT_HEADER_B64 = Buffer.from(JSON.stringify(JWT_HEADER)).toString('base64url');
+
+// Properly formatted mock JWTs that look valid to the frontend, so development
+// works without real Twilio credentials. They never change, so build them once.
+const MOCK_JWT_HEADER = 'eyJhbGciOiJIUzI1NiIsInR5cCI6IkpXVCJ9'; // {"alg":"HS256","typ":"JWT"}
+const MOCK_VISITOR_ACCESS_TOKEN = [
+  MOCK_JWT_HEADER,
+  'eyJpc3MiOiJtb2NrIiwic3ViIjoidGVzdCIsImF1ZCI6WyJ2aWRlbyJdLCJleHAiOjk5OTk5OTk5OTksImlhdCI6MTYwMDAwMDAwMCwianRpIjoibW9ja19qd3RfaWQiLCJncmFudHMiOnsidmlkZW8iOnsicm9vbSI6InRlc3Qtcm9vbSJ9fX0', // Mock payload with video grant
+  'mock_signature_for_development_only',
+].join('.');
+const MOCK_STAFF_ACCESS_TOKEN = [
+  MOCK_JWT_HEADER,
+  'eyJpc3MiOiJtb2NrIiwic3ViIjoic3RhZmYiLCJhdWQiOlsidmlkZW8iXSwiZXhwIjo5OTk5OTk5OTk5LCJpYXQiOjE2MDAwMDAwMDAsImp0aSI6Im1vY2tfc3RhZmZfand0X2lkIiwiZ3JhbnRzIjp7InZpZGVvIjp7InJvb20iOiJ0ZXN0LXJvb20tc3RhZmYifX19',
+  'mock_staff_signature_for_development',
+].join('.');
+
+// Twilio's error code for rejected account credentials
+const TWILIO_AUTHENTICATION_ERROR_CODE = 20003;
+
+// Non-2xx Twilio REST response, keeping the status and Twilio's error code/message
+class TwilioApiError extends Error {
+  constructor(
+    public readonly status: number,
+    public readonly code: number | null,
+    public readonly twilioMessage: string,
+    body: string,
+  ) {
+    super(`Twilio API error: ${status} ${body}`);
+    this.name = 'TwilioApiError';
+  }
+
+  static async fromResponse(response: Response): Promise<TwilioApiError> {
+    const body = await response.text();
+    let code: number | null = null;
+    let twilioMessage = body;
+
+    try {
+      const parsed = JSON.parse(body);
+      code = typeof parsed.code === 'number' ? parsed.code : null;
+      twilioMessage = typeof parsed.message === 'string' ? parsed.message : body;
+    } catch {
+      // Non-JSON error body; keep the raw text as the message
+    }
+
+    return new TwilioApiError(response.status, code, twilioMessage, body);
+  }
+}
+
+// 8 hex characters from 4 random bytes, without building and slicing a full UUID
+function shortId(): string {
+  return randomBytes(4).toString('hex');
+}
+
 export class TwilioService {
   private accountSid: string;
   private authToken: string;
@@ -50,6 +110,10 @@ export class TwilioService {
   private apiSecret: string;
   private frontendUrl: string;
   private useMock: boolean;
+  private signingKey: KeyObject | null = null;
+  private authHeader: string;
+  // Cleared once Twilio rejects the trial timeout parameters for this account
+  private roomTimeoutsSupported = true;
 
   constructor() {
     const config = getTwilioConfig();
@@ -60,6 +124,9 @@ export class TwilioService {
     this.frontendUrl = config.frontendUrl;
     this.useMock = config.useMock;
 
+    // Encode REST credentials once; every Rooms API call sends the same header
+    this.authHeader = `Basic ${Buffer.from(`${this.accountSid}:${this.authToken}`).toString('base64')}`;
+
     if (this.useMock) {
       console.log('⚠️ Twilio credentials not configured. Video calls will be mocked.');
     } else {
@@ -72,7 +139,7 @@ export class TwilioService {
     const sanitizedVisitorName = this.sanitizeNameForIdentity(visitorName);
     
     // Generate unique room name with prefix
-    const roomName = `reception-${uuidv4().substring(0, 8)}`;
+    const roomName = `reception-${shortId()}`;
 
     // If in development mode without credentials, return mock data
     if (this.useMock) {
@@ -87,35 +154,41 @@ export class TwilioService {
       let room: any = null;
       let creationMethod = '';
 
-      try {
-        // Attempt 1: Create room with trial-compatible timeout values
-        room = await this.createTwilioRoom(roomName, {
-          type: 'group', // Group room for up to 50 participants
-          maxParticipants: 2, // Limit to 2 for reception use case
-          recordParticipantsOnConnect: false, // Disable recording for free trial
-          emptyRoomTimeout: 60, // 1 minute (compatible with trial accounts)
-          unusedRoomTimeout: 60, // 1 minute (compatible with trial accounts)
-        });
-        creationMethod = 'with trial-compatible timeouts (60s)';
-
-      } catch (timeoutError) {
-        if (timeoutError instanceof Error && timeoutError.message.includes('Timeout is out of range')) {
-          console.log('⚠️ Trial timeout values failed, trying without timeout parameters...');
-
-          // Attempt 2: Create room without timeout parameters (uses Twilio defaults)
+      if (this.roomTimeoutsSupported) {
+        try {
+          // Attempt 1: Create room with trial-compatible timeout values
           room = await this.createTwilioRoom(roomName, {
-            type: 'group',
-            maxParticipants: 2,
-            recordParticipantsOnConnect: false,
-            // No timeout parameters - uses Twilio defaults
+            type: 'group', // Group room for up to 50 participants
+            maxParticipants: 2, // Limit to 2 for reception use case
+            recordParticipantsOnConnect: false, // Disable recording for free trial
+            emptyRoomTimeout: 60, // 1 minute (compatible with trial accounts)
+            unusedRoomTimeout: 60, // 1 minute (compatible with trial accounts)
           });
-          creationMethod = 'without timeout parameters (Twilio defaults)';
-        } else {
-          // Re-throw if it's not a timeout-related error
-          throw timeoutError;
+          creationMethod = 'with trial-compatible timeouts (60s)';
+
+        } catch (timeoutError) {
+          if (timeoutError instanceof TwilioApiError && timeoutError.twilioMessage.includes('Timeout is out of range')) {
+            console.log('⚠️ Trial timeout values failed, creating rooms without timeout parameters from now on');
+            // The account rejects these timeouts; skip the doomed attempt on later calls
+            this.roomTimeoutsSupported = false;
+          } else {
+            // Re-throw if it's not a timeout-related error
+            throw timeoutError;
+          }
         }
       }
 
+      if (!room) {
+        // Attempt 2: Create room without timeout parameters (uses Twilio defaults)
+        room = await this.createTwilioRoom(roomName, {
+          type: 'group',
+          maxParticipants: 2,
+          recordParticipantsOnConnect: false,
+          // No timeout parameters - uses Twilio defaults
+        });
+        creationMethod = 'without timeout parameters (Twilio defaults)';
+      }
+
       if (room) {
         console.log(`✅ Successfully created Twilio room ${creationMethod}: ${room.sid}`);
       } else {
@@ -124,7 +197,7 @@ export class TwilioService {
 
       // Generate unique access token for visitor with timestamp to prevent duplicates
       const timestamp = Date.now();
-      const sessionId = uuidv4().substring(0, 8);
+      const sessionId = shortId();
       const identity = `${sanitizedVisitorName}_visitor_${timestamp}_${sessionId}`;
       const accessToken = this.generateAccessToken(identity, roomName);
 
@@ -150,13 +223,12 @@ export class TwilioService {
       const errorMessage = error instanceof Error ? error.message : String(error);
       console.error(`❌ Failed to create Twilio room: ${errorMessage}`);
 
-      // Provide specific error messages for common issues
-      if (errorMessage.includes('Type must be one of')) {
-        throw new Error('Invalid room type. Please check Twilio account permissions for room types.');
-      } else if (errorMessage.includes('Invalid Access Token') || errorMessage.toLowerCase().includes('authentication')) {
+      // Provide specific error messages for common issues, classifying Twilio
+      // REST failures by HTTP status and error code rather than the raw body
+      if (error instanceof TwilioApiError && (error.status === 401 || error.code === TWILIO_AUTHENTICATION_ERROR_CODE)) {
         throw new Error('Twilio authentication failed. Please verify TWILIO_ACCOUNT_SID and TWILIO_AUTH_TOKEN.');
-      } else if (errorMessage.includes('API Key')) {
-        throw new Error('API Key error. Ensure TWILIO_API_KEY and TWILIO_API_SECRET are set and the API Key is in US1 region.');
+      } else if (error instanceof TwilioApiError && error.twilioMessage.includes('Type must be one of')) {
+        throw new Error('Invalid room type. Please check Twilio account permissions for room types.');
       } else {
         // For development/testing, return mock response for unknown errors
         console.log('🔧 Falling back to mock response due to Twilio error');
@@ -176,19 +248,13 @@ export class TwilioService {
 
     if (this.useMock) {
       console.log('🔧 Development mode: Returning mock staff token');
-      // Create mock JWT token for staff (similar to visitor token)
-      const mockJwtHeader = 'eyJhbGciOiJIUzI1NiIsInR5cCI6IkpXVCJ9';
-      const mockJwtPayload = 'eyJpc3MiOiJtb2NrIiwic3ViIjoic3RhZmYiLCJhdWQiOlsidmlkZW8iXSwiZXhwIjo5OTk5OTk5OTk5LCJpYXQiOjE2MDAwMDAwMDAsImp0aSI6Im1vY2tfc3RhZmZfand0X2lkIiwiZ3JhbnRzIjp7InZpZGVvIjp7InJvb20iOiJ0ZXN0LXJvb20tc3RhZmYifX19';
-      const mockJwtSignature = 'mock_staff_signature_for_development';
-      const mockStaffToken = `${mockJwtHeader}.${mockJwtPayload}.${mockJwtSignature}`;
-
       // Generate unique mock identity to match production behavior
       const timestamp = Date.now();
-      const sessionId = uuidv4().substring(0, 8);
+      const sessionId = shortId();
       const uniqueIdentity = `${sanitizedStaffName}_staff_${timestamp}_${sessionId}`;
       
       return {
-        access_token: mockStaffToken,
+        access_token: MOCK_STAFF_ACCESS_TOKEN,
         identity: uniqueIdentity,
       };
     }
@@ -196,7 +262,7 @@ export class TwilioService {
     try {
       // Generate unique staff identity with timestamp to prevent duplicates
       const timestamp = Date.now();
-      const sessionId = uuidv4().substring(0, 8);
+      const sessionId = shortId();
       const identity = `${sanitizedStaffName}_staff_${timestamp}_${sessionId}`;
       const accessToken = this.generateAccessToken(identity, roomName);
 
@@ -247,15 +313,14 @@ export class TwilioService {
     const response = await fetch(url, {
       method: 'POST',
       headers: {
-        'Authorization': `Basic ${Buffer.from(`${this.accountSid}:${this.authToken}`).toString('base64')}`,
+        'Authorization': this.authHeader,
         'Content-Type': 'application/x-www-form-urlencoded',
       },
       body: formData,
     });
 
     if (!response.ok) {
-      const errorText = await response.text();
-      throw new Error(`Twilio API error: ${response.status} ${errorText}`);
+      throw await TwilioApiError.fromResponse(response);
     }
 
     return response.json();
@@ -270,15 +335,14 @@ export class TwilioService {
     const response = await fetch(url, {
       method: 'POST',
       headers: {
-        'Authorization': `Basic ${Buffer.from(`${this.accountSid}:${this.authToken}`).toString('base64')}`,
+        'Authorization': this.authHeader,
         'Content-Type': 'application/x-www-form-urlencoded',
       },
       body: formData,
     });
 
     if (!response.ok) {
-      const errorText = await response.text();
-      throw new Error(`Twilio API error: ${response.status} ${errorText}`);
+      throw await TwilioApiError.fromResponse(response);
     }
 
     return response.json();
@@ -294,6 +358,9 @@ export class TwilioService {
       throw new Error('Account SID is required for token generation. Ensure TWILIO_ACCOUNT_SID is set.');
     }
 
+    // Import the secret once and reuse the HMAC key object for every later token
+    const signingKey = (this.signingKey ??= createSecretKey(Buffer.from(this.apiSecret)));
+
     // Validate identity (must be non-empty and valid format)
     if (!identity || !identity.trim()) {
       throw new Error('Identity cannot be empty');
@@ -307,12 +374,6 @@ export class TwilioService {
       const now = Math.floor(Date.now() / 1000);
       const exp = now + 3600; // 1 hour expiry
 
-      const header: JWTHeader = {
-        alg: 'HS256',
-        typ: 'JWT',
-        cty: 'twilio-fpa;v=1'
-      };
-
       const payload: JWTPayload = {
         iss: this.apiKey,
         sub: this.accountSid,
@@ -329,17 +390,14 @@ export class TwilioService {
       };
 
       // Simple JWT creation for Node.js environment
-      const headerB64 = Buffer.from(JSON.stringify(header)).toString('base64url');
       const payloadB64 = Buffer.from(JSON.stringify(payload)).toString('base64url');
       
       // Create signature using HMAC SHA256
-      const crypto = require('crypto');
-      const signature = crypto
-        .createHmac('sha256', this.apiSecret)
-        .update(`${headerB64}.${payloadB64}`)
+      const signature = createHmac('sha256', signingKey)
+        .update(`${JWT_HEADER_B64}.${payloadB64}`)
         .digest('base64url');
 
-      const jwtToken = `${headerB64}.${payloadB64}.${signature}`;
+      const jwtToken = `${JWT_HEADER_B64}.${payloadB64}.${signature}`;
       
       console.log(`✅ Generated JWT token for identity: ${sanitizedIdentity}, room: ${roomName}`);
       console.log(`🔐 Identity details - Original: ${identity}, Sanitized: ${sanitizedIdentity}, Room: ${roomName}`);
@@ -356,22 +414,15 @@ export class TwilioService {
     const createdAt = new Date();
     const expiresAt = new Date(createdAt.getTime() + 60 * 60 * 1000); // 1 hour
 
-    // Create a properly formatted mock JWT token that looks valid to frontend
-    // This allows development testing without real Twilio credentials
-    const mockJwtHeader = 'eyJhbGciOiJIUzI1NiIsInR5cCI6IkpXVCJ9'; // {"alg":"HS256","typ":"JWT"}
-    const mockJwtPayload = 'eyJpc3MiOiJtb2NrIiwic3ViIjoidGVzdCIsImF1ZCI6WyJ2aWRlbyJdLCJleHAiOjk5OTk5OTk5OTksImlhdCI6MTYwMDAwMDAwMCwianRpIjoibW9ja19qd3RfaWQiLCJncmFudHMiOnsidmlkZW8iOnsicm9vbSI6InRlc3Qtcm9vbSJ9fX0'; // Mock payload with video grant
-    const mockJwtSignature = 'mock_signature_for_development_only';
-    const mockAccessToken = `${mockJwtHeader}.${mockJwtPayload}.${mockJwtSignature}`;
-
     // Generate unique mock visitor identity to match production behavior
     const timestamp = Date.now();
-    const sessionId = uuidv4().substring(0, 8);
+    const sessionId = shortId();
     const uniqueVisitorIdentity = `${visitorName}_visitor_${timestamp}_${sessionId}`;
 
     return {
       room_name: roomName,
       room_sid: `mock_sid_${roomName}`,
-      access_token: mockAccessToken,
+      access_token: MOCK_VISITOR_ACCESS_TOKEN,
       room_url: `${this.frontendUrl}/video-call?room=${roomName}&staff=true`,
       created_at: createdAt.toISOString(),
       expires_at: expiresAt.toISOString(),
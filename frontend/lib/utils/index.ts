@@ -20,6 +20,20 @@ export function formatTimestamp(date: Date): string {
   });
 }
 
+// Built once so notification timestamps skip locale/time zone resolution per call
+const SHORT_TIMESTAMP_FORMAT = new Intl.DateTimeFormat('ja-JP', {
+  timeZone: 'Asia/Tokyo',
+  year: 'numeric',
+  month: '2-digit',
+  day: '2-digit',
+  hour: '2-digit',
+  minute: '2-digit',
+});
+
+export function formatShortTimestamp(date: Date): string {
+  return SHORT_TIMESTAMP_FORMAT.format(date);
+}
+
 export function formatTime(date: Date): string {
   return date.toLocaleTimeString('ja-JP', {
     timeZone: 'Asia/Tokyo',